@@ -81,12 +81,10 @@ def _impute_single_column(
     month_col: str,
 ) -> None:
     """In-place 3-level imputation for a single price column."""
-    # Level 1: customer ffill/bfill
-    filled = (
-        scm.groupby(KEY, sort=False)[col]
-        .apply(lambda s: s.ffill().bfill())
-        .reset_index(level=0, drop=True)
-    )
+    # Level 1: customer ffill/bfill (groupby fill kernels, no per-group Python apply)
+    customers = scm[KEY]
+    filled = scm[col].groupby(customers, sort=False).ffill()
+    filled = filled.groupby(customers, sort=False).bfill()
     need = mask & scm[col].isna()
     if need.any():
         scm.loc[need, col] = filled.loc[need]
@@ -111,31 +109,26 @@ def _impute_single_column(
 def derive_customer_segments(sc: pd.DataFrame) -> pd.DataFrame:
     """Derive segment (Residential/SME/Corporate) and residential_type."""
     sc = sc.copy()
-    sc["segment"] = None
+    industrial = sc["is_industrial"]
+    power = sc["contracted_power_kw"]
 
     # Residential: not industrial
-    sc.loc[sc["is_industrial"] == 0, "segment"] = "Residential"
-
     # Industrial: SME if contracted_power_kw == 10, Corporate if > 10
-    sc.loc[
-        (sc["is_industrial"] == 1) & (sc["contracted_power_kw"] == 10),
-        "segment",
-    ] = "SME"
-    sc.loc[
-        (sc["is_industrial"] == 1) & (sc["contracted_power_kw"] > 10),
-        "segment",
-    ] = "Corporate"
+    segment = np.select(
+        [industrial == 0, (industrial == 1) & (power == 10), (industrial == 1) & (power > 10)],
+        ["Residential", "SME", "Corporate"],
+        default=None,
+    )
+    sc["segment"] = pd.Series(segment, index=sc.index, dtype=object)
 
     # Residential sub-type
-    sc["residential_type"] = None
-    sc.loc[
-        (sc["segment"] == "Residential") & (sc["is_second_residence"] == 1),
-        "residential_type",
-    ] = "Second_Residence"
-    sc.loc[
-        (sc["segment"] == "Residential") & (sc["is_second_residence"] == 0),
-        "residential_type",
-    ] = "Primary_Residence"
+    residential = sc["segment"] == "Residential"
+    residential_type = np.select(
+        [residential & (sc["is_second_residence"] == 1), residential & (sc["is_second_residence"] == 0)],
+        ["Second_Residence", "Primary_Residence"],
+        default=None,
+    )
+    sc["residential_type"] = pd.Series(residential_type, index=sc.index, dtype=object)
 
     return sc
 
@@ -149,74 +142,83 @@ def clean_sales_channels(sc: pd.DataFrame) -> pd.DataFrame:
     if "sales_channel" not in sc.columns:
         return sc
 
-    cleaned = sc["sales_channel"].astype(str).str.strip().str.lower()
-    sc["sales_channel"] = cleaned.map(CHANNEL_MAP).fillna(cleaned)
+    # Normalise and translate each distinct channel once, then broadcast via the codes
+    channel = sc["sales_channel"]
+    codes, uniques = pd.factorize(channel)
+    result = _normalise_channels(pd.Series(uniques)).reindex(codes).set_axis(sc.index)
+    missing = codes == -1
+    if missing.any():
+        # factorize merges None and NaN, but astype(str) renders them differently
+        # on pandas 2.x ("None" vs "nan"), so missing rows take the per-row path.
+        result = result.fillna(_normalise_channels(channel[missing]))
+    sc["sales_channel"] = result
     return sc
 
 
+def _normalise_channels(channels: pd.Series) -> pd.Series:
+    cleaned = channels.astype(str).str.strip().str.lower()
+    return cleaned.map(CHANNEL_MAP).fillna(cleaned)
+
+
 # ── Margin computation ───────────────────────────────────────────────────────
 
 
 def compute_margins(scm: pd.DataFrame) -> pd.DataFrame:
-    """Compute electricity margin, gas margin, and total margin per customer-month."""
-    df = scm.copy()
+    """Compute electricity margin, gas margin, and total margin per customer-month.
 
-    # ── Electricity P&L ──
+    Inputs are coerced once, the P&L is evaluated on the underlying NumPy arrays and
+    all output columns are attached in a single ``assign``.
+    """
     elec_cols = [
         "elec_kwh_tier_1_peak", "elec_kwh_tier_2_standard", "elec_kwh_tier_3_offpeak",
         "variable_price_tier1_eur_kwh", "variable_price_tier2_eur_kwh", "variable_price_tier3_eur_kwh",
         "elec_fixed_fee_eur_month", "monthly_elec_kwh",
         "elec_var_cost_eur_kwh", "peaje_elec_eur_kwh", "elec_fixed_cost_eur_month",
     ]
-    for c in elec_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0)
-
-    df["elec_revenue_variable"] = (
-        df.get("elec_kwh_tier_1_peak", 0) * df.get("variable_price_tier1_eur_kwh", 0)
-        + df.get("elec_kwh_tier_2_standard", 0) * df.get("variable_price_tier2_eur_kwh", 0)
-        + df.get("elec_kwh_tier_3_offpeak", 0) * df.get("variable_price_tier3_eur_kwh", 0)
-    )
-    df["elec_revenue_fixed"] = df.get("elec_fixed_fee_eur_month", 0)
-    df["elec_cost_variable"] = df.get("monthly_elec_kwh", 0) * (
-        df.get("elec_var_cost_eur_kwh", 0) + df.get("peaje_elec_eur_kwh", 0)
-    )
-    df["elec_cost_fixed"] = df.get("elec_fixed_cost_eur_month", 0)
-    df["elec_margin"] = (
-        df["elec_revenue_variable"] + df["elec_revenue_fixed"]
-        - df["elec_cost_variable"] - df["elec_cost_fixed"]
-    )
-
-    # ── Gas P&L ──
     gas_cols = [
         "monthly_gas_m3", "gas_variable_price_eur_m3",
         "gas_fixed_revenue_eur_year", "gas_var_cost_eur_m3", "gas_fixed_cost_eur_year",
     ]
-    for c in gas_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0)
-
-    df["gas_revenue_variable"] = df.get("monthly_gas_m3", 0) * df.get("gas_variable_price_eur_m3", 0)
-    df["gas_revenue_fixed"] = df.get("gas_fixed_revenue_eur_year", 0) / 12
-    df["gas_cost_variable"] = df.get("monthly_gas_m3", 0) * df.get("gas_var_cost_eur_m3", 0)
-    df["gas_cost_fixed"] = df.get("gas_fixed_cost_eur_year", 0) / 12
-    df["gas_margin"] = (
-        df["gas_revenue_variable"] + df["gas_revenue_fixed"]
-        - df["gas_cost_variable"] - df["gas_cost_fixed"]
+    coerced = {
+        c: pd.to_numeric(scm[c], errors="coerce").fillna(0)
+        for c in elec_cols + gas_cols
+        if c in scm.columns
+    }
+
+    def v(col: str):
+        # Missing inputs contribute a scalar 0, as before
+        return coerced[col].to_numpy() if col in coerced else 0
+
+    out: dict[str, object] = {}
+
+    # ── Electricity P&L ──
+    out["elec_revenue_variable"] = (
+        v("elec_kwh_tier_1_peak") * v("variable_price_tier1_eur_kwh")
+        + v("elec_kwh_tier_2_standard") * v("variable_price_tier2_eur_kwh")
+        + v("elec_kwh_tier_3_offpeak") * v("variable_price_tier3_eur_kwh")
     )
+    out["elec_revenue_fixed"] = v("elec_fixed_fee_eur_month")
+    out["elec_cost_variable"] = v("monthly_elec_kwh") * (v("elec_var_cost_eur_kwh") + v("peaje_elec_eur_kwh"))
+    out["elec_cost_fixed"] = v("elec_fixed_cost_eur_month")
+    elec_revenue = out["elec_revenue_variable"] + out["elec_revenue_fixed"]
+    elec_cost = out["elec_cost_variable"] + out["elec_cost_fixed"]
+    out["elec_margin"] = elec_revenue - elec_cost
+
+    # ── Gas P&L ──
+    out["gas_revenue_variable"] = v("monthly_gas_m3") * v("gas_variable_price_eur_m3")
+    out["gas_revenue_fixed"] = v("gas_fixed_revenue_eur_year") / 12
+    out["gas_cost_variable"] = v("monthly_gas_m3") * v("gas_var_cost_eur_m3")
+    out["gas_cost_fixed"] = v("gas_fixed_cost_eur_year") / 12
+    gas_revenue = out["gas_revenue_variable"] + out["gas_revenue_fixed"]
+    gas_cost = out["gas_cost_variable"] + out["gas_cost_fixed"]
+    out["gas_margin"] = gas_revenue - gas_cost
 
     # ── Totals ──
-    df["total_revenue"] = (
-        df["elec_revenue_variable"] + df["elec_revenue_fixed"]
-        + df["gas_revenue_variable"] + df["gas_revenue_fixed"]
-    )
-    df["total_cost"] = (
-        df["elec_cost_variable"] + df["elec_cost_fixed"]
-        + df["gas_cost_variable"] + df["gas_cost_fixed"]
-    )
-    df["total_margin"] = df["total_revenue"] - df["total_cost"]
+    out["total_revenue"] = elec_revenue + gas_revenue
+    out["total_cost"] = elec_cost + gas_cost
+    out["total_margin"] = out["total_revenue"] - out["total_cost"]
 
-    return df
+    return scm.assign(**coerced, **out)
 
 
 # ── Silver orchestration ─────────────────────────────────────────────────────
@@ -29,10 +29,12 @@ def get_s3_client(region: str = "eu-west-1"):
     return boto3.client("s3", region_name=region)
 
 
-def read_parquet(bucket: str, key: str, region: str = "eu-west-1") -> pd.DataFrame:
+def read_parquet(
+    bucket: str, key: str, region: str = "eu-west-1", columns: list[str] | None = None
+) -> pd.DataFrame:
     s3 = get_s3_client(region)
     obj = s3.get_object(Bucket=bucket, Key=key)
-    return pd.read_parquet(io.BytesIO(obj["Body"].read()))
+    return pd.read_parquet(io.BytesIO(obj["Body"].read()), columns=columns)
 
 
 def read_parquet_batches(
@@ -7,8 +7,14 @@ import os
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Module-level configuration from environment variables
 # ---------------------------------------------------------------------------
@@ -18,21 +24,92 @@ AWS_REGION = os.getenv("AWS_REGION", "eu-west-1")
 DYNAMODB_TABLE = os.getenv("DYNAMODB_MANIFEST_TABLE", "spanishgas-dev-pipeline-manifest")
 
 
+def _read_json(p: Path):
+    """Parse a local JSON file, using orjson's C parser when it is installed.
+
+    Files written by json.dumps may contain NaN/Infinity, which orjson rejects;
+    those fall back to the stdlib parser on the same bytes.
+    """
+    data = p.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# path -> (mtime, columns, frame). One entry per file, so a rewritten parquet
+# replaces its old frame instead of keeping every version alive.
+_parquet_cache: dict[str, tuple[float, tuple[str, ...] | None, pd.DataFrame]] = {}
+
+
+def _read_parquet_table(path: str, columns: tuple[str, ...] | None) -> pd.DataFrame:
+    # self_destruct frees each Arrow column as it is converted, so peak memory
+    # stays near one copy of the frame instead of two. use_pandas_metadata keeps
+    # a stored index when columns are projected, as pd.read_parquet does.
+    table = pq.read_table(
+        path, columns=list(columns) if columns is not None else None, use_pandas_metadata=True
+    )
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _read_local_parquet(p: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Read a local parquet file, memoising the latest read of each path.
+
+    Keeps repeat reads free even when st.cache_data is bypassed, and re-reads as
+    soon as the file's mtime or the requested columns change. Callers get a
+    shallow copy.
+    """
+    key = str(p)
+    mtime = p.stat().st_mtime
+    key_cols = tuple(columns) if columns is not None else None
+    cached = _parquet_cache.get(key)
+    if cached is not None and cached[:2] == (mtime, key_cols):
+        frame = cached[2]
+    else:
+        frame = _read_parquet_table(key, key_cols)
+        _parquet_cache[key] = (mtime, key_cols, frame)
+    return frame.copy(deep=False)
+
+
+def _require_duckdb_for_filters(source: str, filters: str | None) -> None:
+    """Row filters only run in the DuckDB scan; refuse them instead of returning every row."""
+    if filters is not None and source != "duckdb":
+        raise ValueError(f"filters requires source='duckdb', got source={source!r}")
+
+
+def _read_parquet_duckdb(path: Path, columns: list[str] | None = None, filters: str | None = None) -> pd.DataFrame:
+    """Scan a local parquet file with DuckDB so projection and filters run below the scan.
+
+    ``filters`` is a trusted SQL boolean expression (e.g. ``"churn_proba > 0.5"``).
+    """
+    import duckdb
+
+    select = ", ".join('"' + c.replace('"', '""') + '"' for c in columns) if columns else "*"
+    where = f" WHERE {filters}" if filters else ""
+    with duckdb.connect() as con:
+        return con.execute(f"SELECT {select} FROM read_parquet(?){where}", [str(path)]).df()
+
+
 @st.cache_data(ttl=300)
-def load_scored_data(source: str | None = None, path: str = "data/scored/scored_customers.parquet", **kwargs) -> pd.DataFrame:
-    """Load scored customer data from local parquet or S3."""
+def load_scored_data(source: str | None = None, path: str = "data/scored/scored_customers.parquet", columns: list[str] | None = None, filters: str | None = None, **kwargs) -> pd.DataFrame:
+    """Load scored customer data from local parquet (eagerly or via DuckDB) or S3."""
     source = source or DATA_SOURCE
+    _require_duckdb_for_filters(source, filters)
     if source == "s3":
         from src.pipelines.s3_io import read_parquet
 
         bucket = kwargs.get("bucket", S3_BUCKET)
         key = kwargs.get("key", "scored/scored_customers.parquet")
         region = kwargs.get("region", AWS_REGION)
-        return read_parquet(bucket, key, region)
+        return read_parquet(bucket, key, region, columns=columns)
 
     p = Path(path)
     if p.exists():
-        return pd.read_parquet(p)
+        if source == "duckdb":
+            return _read_parquet_duckdb(p, columns, filters)
+        return _read_local_parquet(p, columns)
     return pd.DataFrame()
 
 
@@ -50,8 +127,7 @@ def load_model_metrics(source: str | None = None, path: str = "data/models/lates
 
     p = Path(path)
     if p.exists():
-        with open(p) as f:
-            return json.load(f)
+        return _read_json(p)
     return {}
 
 
@@ -69,14 +145,13 @@ def load_drift_results(source: str | None = None, path: str = "data/monitoring/d
 
     p = Path(path)
     if p.exists():
-        with open(p) as f:
-            return json.load(f)
+        return _read_json(p)
     return {}
 
 
 @st.cache_data(ttl=60)
-def load_pipeline_runs(source: str | None = None, path: str = "data/monitoring/pipeline_runs.json", **kwargs) -> list[dict]:
-    """Load pipeline run history.
+def load_pipeline_runs(source: str | None = None, path: str = "data/monitoring/pipeline_runs.json", **kwargs) -> tuple[dict, ...]:
+    """Load pipeline run history as an immutable tuple, newest first for DynamoDB.
 
     Each run dict has: run_id, file_key, status, started_at, completed_at (optional).
     In production reads from DynamoDB via scan; locally from JSON file.
@@ -93,46 +168,51 @@ def load_pipeline_runs(source: str | None = None, path: str = "data/monitoring/p
         while "LastEvaluatedKey" in resp:
             resp = table.scan(ExclusiveStartKey=resp["LastEvaluatedKey"])
             items.extend(resp.get("Items", []))
-        return sorted(items, key=lambda x: x.get("started_at", ""), reverse=True)
+        return tuple(sorted(items, key=lambda x: x.get("started_at", ""), reverse=True))
 
     p = Path(path)
     if p.exists():
-        with open(p) as f:
-            return json.load(f)
-    return []
+        return tuple(_read_json(p))
+    return ()
 
 
 @st.cache_data(ttl=300)
-def load_gold_data(source: str | None = None, path: str = "data/gold/gold_master.parquet", **kwargs) -> pd.DataFrame:
-    """Load gold master data for EDA exploration."""
+def load_gold_data(source: str | None = None, path: str = "data/gold/gold_master.parquet", columns: list[str] | None = None, filters: str | None = None, **kwargs) -> pd.DataFrame:
+    """Load gold master data for EDA exploration (local parquet, DuckDB scan, or S3)."""
     source = source or DATA_SOURCE
+    _require_duckdb_for_filters(source, filters)
     if source == "s3":
         from src.pipelines.s3_io import read_parquet
 
         bucket = kwargs.get("bucket", S3_BUCKET)
         key = kwargs.get("key", "gold/gold_master.parquet")
         region = kwargs.get("region", AWS_REGION)
-        return read_parquet(bucket, key, region)
+        return read_parquet(bucket, key, region, columns=columns)
 
     p = Path(path)
     if p.exists():
-        return pd.read_parquet(p)
+        if source == "duckdb":
+            return _read_parquet_duckdb(p, columns, filters)
+        return _read_local_parquet(p, columns)
     return pd.DataFrame()
 
 
 @st.cache_data(ttl=300)
-def load_recommendations(source: str | None = None, path: str = "data/scored/recommendations.parquet", **kwargs) -> pd.DataFrame:
-    """Load recommendation results."""
+def load_recommendations(source: str | None = None, path: str = "data/scored/recommendations.parquet", columns: list[str] | None = None, filters: str | None = None, **kwargs) -> pd.DataFrame:
+    """Load recommendation results (local parquet, DuckDB scan, or S3)."""
     source = source or DATA_SOURCE
+    _require_duckdb_for_filters(source, filters)
     if source == "s3":
         from src.pipelines.s3_io import read_parquet
 
         bucket = kwargs.get("bucket", S3_BUCKET)
         key = kwargs.get("key", "scored/recommendations.parquet")
         region = kwargs.get("region", AWS_REGION)
-        return read_parquet(bucket, key, region)
+        return read_parquet(bucket, key, region, columns=columns)
 
     p = Path(path)
     if p.exists():
-        return pd.read_parquet(p)
+        if source == "duckdb":
+            return _read_parquet_duckdb(p, columns, filters)
+        return _read_local_parquet(p, columns)
     return pd.DataFrame()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import plotly.express as px
 import streamlit as st
 
 from src.serving.ui.data_loader import load_scored_data
@@ -39,6 +38,8 @@ def render() -> None:
             st.subheader("Risk Tier Distribution")
             tier_counts = scored["risk_tier"].value_counts().reset_index()
             tier_counts.columns = ["Risk Tier", "Count"]
+            import plotly.express as px
+
             fig = px.pie(tier_counts, names="Risk Tier", values="Count",
                          color_discrete_sequence=px.colors.qualitative.Set2)
             st.plotly_chart(fig, use_container_width=True)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import plotly.express as px
 import streamlit as st
 
 from src.serving.ui.data_loader import load_gold_data
@@ -16,6 +15,8 @@ def render() -> None:
         st.warning("No gold master data available. Run the pipeline first.")
         return
 
+    import plotly.express as px
+
     # ------------------------------------------------------------------
     # 1. Customer Segment Breakdown
     # ------------------------------------------------------------------
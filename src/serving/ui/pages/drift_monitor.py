@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
 from src.serving.ui.data_loader import load_drift_results
@@ -39,13 +39,12 @@ def render() -> None:
 
         # Color-coded table
         st.dataframe(
-            df[["feature", "ks_statistic", "p_value", "status"]].style.apply(
-                lambda row: ["background-color: #ffcccc" if row["status"] == "DRIFTED" else "" for _ in row],
-                axis=1,
-            ),
+            df[["feature", "ks_statistic", "p_value", "status"]].style.apply(_highlight_drifted, axis=None),
             use_container_width=True,
         )
 
+        import plotly.express as px
+
         # KS statistic bar chart
         fig = px.bar(
             df.sort_values("ks_statistic", ascending=False),
@@ -62,3 +61,13 @@ def render() -> None:
         st.subheader("Prediction Drift")
         st.metric("KS Statistic", f"{pred_drift.get('ks_statistic', 0):.4f}")
         st.metric("p-value", f"{pred_drift.get('p_value', 0):.6f}")
+
+
+def _highlight_drifted(table: pd.DataFrame) -> pd.DataFrame:
+    """Red background on every cell of drifted rows, built in one vectorized pass."""
+    row_css = np.where(table["status"] == "DRIFTED", "background-color: #ffcccc", "")
+    return pd.DataFrame(
+        np.repeat(row_css[:, None], table.shape[1], axis=1),
+        index=table.index,
+        columns=table.columns,
+    )
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import numpy as np
-import plotly.express as px
 import streamlit as st
 
 from src.serving.ui.data_loader import load_model_metrics
@@ -36,6 +35,8 @@ def render() -> None:
 
     if tp + fp + fn + tn > 0:
         st.subheader("Confusion Matrix")
+        import plotly.express as px
+
         cm = np.array([[tn, fp], [fn, tp]])
         fig = px.imshow(
             cm,
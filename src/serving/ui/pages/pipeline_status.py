@@ -23,12 +23,10 @@ def render() -> None:
     col1.metric("Total Runs", len(df))
 
     if "status" in df.columns:
-        completed = int((df["status"] == "completed").sum())
-        started = int((df["status"] == "started").sum())
-        failed = int((df["status"] == "failed").sum())
-        col2.metric("Completed", completed)
-        col3.metric("In Progress", started)
-        col4.metric("Failed", failed)
+        counts = df["status"].value_counts()
+        col2.metric("Completed", int(counts.get("completed", 0)))
+        col3.metric("In Progress", int(counts.get("started", 0)))
+        col4.metric("Failed", int(counts.get("failed", 0)))
 
     st.divider()
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import plotly.express as px
 import streamlit as st
 
 from src.serving.ui.data_loader import load_recommendations, load_scored_data
@@ -20,6 +19,8 @@ def render() -> None:
         )
         return
 
+    import plotly.express as px
+
     # ------------------------------------------------------------------
     # Offer Policy Reference
     # ------------------------------------------------------------------
@@ -10,14 +10,10 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 import pytest
-from sklearn.dummy import DummyClassifier
-from sklearn.pipeline import Pipeline
 
 from src.data.ingest import build_bronze_customer, build_bronze_customer_month
 from src.data.silver import build_silver_tables
 from src.features.build_features import build_gold_master
-from src.models.preprocessing import build_preprocessing_pipeline
-from src.models.scorer import assign_risk_tiers, score_all_customers
 
 # ---------------------------------------------------------------------------
 # Shared fixtures — realistic synthetic data matching actual column schemas
@@ -30,43 +26,43 @@ N_CUSTOMERS = 50
 @pytest.fixture
 def synthetic_churn():
     """Churn labels (1 row per customer)."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     return pd.DataFrame({
         "customer_id": [f"C{i:04d}" for i in range(N_CUSTOMERS)],
-        "churn": np.random.choice([0, 1], N_CUSTOMERS, p=[0.85, 0.15]),
+        "churn": rng.choice([0, 1], N_CUSTOMERS, p=[0.85, 0.15]),
     })
 
 
 @pytest.fixture
 def synthetic_attributes():
     """Customer attributes aligned with bronze_customer merge."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     return pd.DataFrame({
         "customer_id": [f"C{i:04d}" for i in range(N_CUSTOMERS)],
-        "province": np.random.choice(["Madrid", "Barcelona", "Valencia", "Sevilla"], N_CUSTOMERS),
-        "is_industrial": np.random.choice([0, 0, 0, 1], N_CUSTOMERS),
-        "contracted_power_kw": np.random.choice([3.5, 5.0, 10.0, 50.0], N_CUSTOMERS),
-        "is_second_residence": np.random.choice([0, 1], N_CUSTOMERS, p=[0.8, 0.2]),
-        "subscribed_power": np.random.uniform(3, 15, N_CUSTOMERS),
-        "sales_channel": np.random.choice(
+        "province": rng.choice(["Madrid", "Barcelona", "Valencia", "Sevilla"], N_CUSTOMERS),
+        "is_industrial": rng.choice([0, 0, 0, 1], N_CUSTOMERS),
+        "contracted_power_kw": rng.choice([3.5, 5.0, 10.0, 50.0], N_CUSTOMERS),
+        "is_second_residence": rng.choice([0, 1], N_CUSTOMERS, p=[0.8, 0.2]),
+        "subscribed_power": rng.uniform(3, 15, N_CUSTOMERS),
+        "sales_channel": rng.choice(
             ["comparador", "telemarketing", "presencial_comercial", "web_propia"],
             N_CUSTOMERS,
         ),
         "customer_first_activation_date": pd.to_datetime(
-            np.random.choice(pd.date_range("2020-01-01", "2023-12-01", freq="MS"), N_CUSTOMERS)
+            rng.choice(pd.date_range("2020-01-01", "2023-12-01", freq="MS"), N_CUSTOMERS)
         ),
         "next_renewal_date": pd.to_datetime(
-            np.random.choice(pd.date_range("2024-06-01", "2026-01-01", freq="MS"), N_CUSTOMERS)
+            rng.choice(pd.date_range("2024-06-01", "2026-01-01", freq="MS"), N_CUSTOMERS)
         ),
-        "is_high_competition_province": np.random.choice([0, 1], N_CUSTOMERS),
-        "has_interaction": np.random.choice([0, 1], N_CUSTOMERS, p=[0.4, 0.6]),
-        "customer_intent": np.random.choice(
+        "is_high_competition_province": rng.choice([0, 1], N_CUSTOMERS),
+        "has_interaction": rng.choice([0, 1], N_CUSTOMERS, p=[0.4, 0.6]),
+        "customer_intent": rng.choice(
             ["Pricing Offers", "Cancel", "General Inquiry", None], N_CUSTOMERS
         ),
-        "sentiment_label": np.random.choice(["Negative", "Neutral", "Positive", None], N_CUSTOMERS),
-        "sentiment_neg": np.random.uniform(0, 1, N_CUSTOMERS).round(2),
-        "sentiment_pos": np.random.uniform(0, 1, N_CUSTOMERS).round(2),
-        "sentiment_neu": np.random.uniform(0, 1, N_CUSTOMERS).round(2),
+        "sentiment_label": rng.choice(["Negative", "Neutral", "Positive", None], N_CUSTOMERS),
+        "sentiment_neg": rng.uniform(0, 1, N_CUSTOMERS).round(2),
+        "sentiment_pos": rng.uniform(0, 1, N_CUSTOMERS).round(2),
+        "sentiment_neu": rng.uniform(0, 1, N_CUSTOMERS).round(2),
         "segment": None,  # will be derived in silver
     })
 
@@ -74,24 +70,24 @@ def synthetic_attributes():
 @pytest.fixture
 def synthetic_contracts():
     """Contract data (1 row per customer)."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     return pd.DataFrame({
         "customer_id": [f"C{i:04d}" for i in range(N_CUSTOMERS)],
-        "contract_start_date": pd.to_datetime("2020-01-01"),
-        "contract_end_date": pd.to_datetime("2025-01-01"),
-        "has_gas": np.random.choice([0, 1], N_CUSTOMERS),
-        "channel": np.random.choice(["online", "branch", "phone"], N_CUSTOMERS),
+        "contract_start_date": np.datetime64("2020-01-01", "ns"),
+        "contract_end_date": np.datetime64("2025-01-01", "ns"),
+        "has_gas": rng.choice([0, 1], N_CUSTOMERS),
+        "channel": rng.choice(["online", "branch", "phone"], N_CUSTOMERS),
     })
 
 
 @pytest.fixture
 def synthetic_interactions():
     """Interaction data (some customers have multiple, some have none)."""
-    np.random.seed(42)
-    ids = np.random.choice([f"C{i:04d}" for i in range(N_CUSTOMERS)], N_CUSTOMERS * 2)
+    rng = np.random.default_rng(42)
+    ids = rng.choice([f"C{i:04d}" for i in range(N_CUSTOMERS)], N_CUSTOMERS * 2)
     return pd.DataFrame({
         "customer_id": ids,
-        "interaction_type": np.random.choice(["complaint", "inquiry", "payment"], len(ids)),
+        "interaction_type": rng.choice(["complaint", "inquiry", "payment"], len(ids)),
         "interaction_date": pd.date_range("2023-01-01", periods=len(ids), freq="D")[: len(ids)],
     })
 
@@ -99,20 +95,17 @@ def synthetic_interactions():
 @pytest.fixture
 def synthetic_consumption():
     """Hourly consumption for a subset of customers (3 months of data)."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     hours = pd.date_range("2024-01-01", "2024-03-31 23:00", freq="h")
     # Only use first 10 customers for speed
     cust_ids = [f"C{i:04d}" for i in range(10)]
-    rows = []
-    for cid in cust_ids:
-        for ts in hours:
-            rows.append({
-                "customer_id": cid,
-                "timestamp": ts,
-                "consumption_elec_kwh": max(0, np.random.normal(2.0, 0.8)),
-                "consumption_gas_m3": max(0, np.random.normal(0.3, 0.15)),
-            })
-    return pd.DataFrame(rows)
+    n_total = len(cust_ids) * len(hours)
+    return pd.DataFrame({
+        "customer_id": np.repeat(cust_ids, len(hours)),
+        "timestamp": np.tile(hours.values, len(cust_ids)),
+        "consumption_elec_kwh": np.maximum(0.0, rng.normal(2.0, 0.8, n_total)),
+        "consumption_gas_m3": np.maximum(0.0, rng.normal(0.3, 0.15, n_total)),
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -263,21 +256,27 @@ class TestScoreE2E:
         """Train a simple model on gold master features for scoring tests.
 
         Uses RandomForest for a realistic but fast pipeline. Only uses numeric
-        features to keep the fixture simple and deterministic.
+        features to keep the fixture simple and deterministic. Also returns the
+        median-filled gold master so scoring tests share the training fill.
+        sklearn is imported here so collecting this module does not pay for it.
         """
+        from sklearn.dummy import DummyClassifier
+        from sklearn.pipeline import Pipeline
+
+        from src.models.preprocessing import build_preprocessing_pipeline
+
+        dtypes = gold_master.dtypes
         feature_cols = [
             c for c in gold_master.columns
-            if c not in ("customer_id", "churn") and gold_master[c].dtype in ("float64", "int64", "Int64")
+            if c not in ("customer_id", "churn") and dtypes[c] in ("float64", "int64", "Int64")
         ]
         # Need at least a few features
         assert len(feature_cols) >= 2, f"Not enough numeric features: {feature_cols}"
 
-        X = gold_master[feature_cols].copy()
+        # Fill NaN for training and scoring with the same medians (simple median fill)
+        X = gold_master[feature_cols].fillna(gold_master[feature_cols].median())
         y = gold_master["churn"].copy()
 
-        # Fill NaN for training (simple median fill)
-        X = X.fillna(X.median())
-
         preprocessor = build_preprocessing_pipeline(X, scale_numeric=False, ohe_sparse=False)
         pipeline = Pipeline([
             ("preprocessor", preprocessor),
@@ -285,65 +284,54 @@ class TestScoreE2E:
         ])
         pipeline.fit(X, y)
 
-        return pipeline, feature_cols
+        gold_filled = gold_master.copy()
+        gold_filled[feature_cols] = X
 
-    def test_score_all_produces_expected_columns(self, gold_master, trained_pipeline_and_features):
-        """score_all_customers should produce churn_proba, churn_pred columns."""
-        pipeline, feature_cols = trained_pipeline_and_features
+        return pipeline, feature_cols, gold_filled
 
-        # Fill NaN in gold for scoring (matches training)
-        gold_filled = gold_master.copy()
-        for col in feature_cols:
-            if col in gold_filled.columns:
-                gold_filled[col] = gold_filled[col].fillna(gold_filled[col].median())
+    @pytest.fixture
+    def scorer(self):
+        """The scorer module, imported once here rather than in each test body."""
+        from src.models import scorer
 
-        scored = score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
+        return scorer
+
+    def test_score_all_produces_expected_columns(self, scorer, trained_pipeline_and_features):
+        """score_all_customers should produce churn_proba, churn_pred columns."""
+        pipeline, feature_cols, gold_filled = trained_pipeline_and_features
+
+        scored = scorer.score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
 
         assert "churn_proba" in scored.columns
         assert "churn_pred" in scored.columns
         assert "customer_id" in scored.columns
 
-    def test_score_probabilities_valid_range(self, gold_master, trained_pipeline_and_features):
+    def test_score_probabilities_valid_range(self, scorer, trained_pipeline_and_features):
         """Churn probabilities must be between 0 and 1."""
-        pipeline, feature_cols = trained_pipeline_and_features
-
-        gold_filled = gold_master.copy()
-        for col in feature_cols:
-            if col in gold_filled.columns:
-                gold_filled[col] = gold_filled[col].fillna(gold_filled[col].median())
+        pipeline, feature_cols, gold_filled = trained_pipeline_and_features
 
-        scored = score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
+        scored = scorer.score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
 
         assert scored["churn_proba"].min() >= 0.0
         assert scored["churn_proba"].max() <= 1.0
 
-    def test_risk_tiers_assigned(self, gold_master, trained_pipeline_and_features):
+    def test_risk_tiers_assigned(self, scorer, trained_pipeline_and_features):
         """assign_risk_tiers should add a risk_tier column with valid labels."""
-        pipeline, feature_cols = trained_pipeline_and_features
+        pipeline, feature_cols, gold_filled = trained_pipeline_and_features
 
-        gold_filled = gold_master.copy()
-        for col in feature_cols:
-            if col in gold_filled.columns:
-                gold_filled[col] = gold_filled[col].fillna(gold_filled[col].median())
-
-        scored = score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
-        scored = assign_risk_tiers(scored)
+        scored = scorer.score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
+        scored = scorer.assign_risk_tiers(scored)
 
         assert "risk_tier" in scored.columns
         valid_tiers = {"Low (<40%)", "Medium (40-60%)", "High (60-80%)", "Critical (>80%)"}
         actual_tiers = set(scored["risk_tier"].dropna().unique())
         assert actual_tiers.issubset(valid_tiers)
 
-    def test_scored_row_count_matches_gold(self, gold_master, trained_pipeline_and_features):
+    def test_scored_row_count_matches_gold(self, scorer, gold_master, trained_pipeline_and_features):
         """Every customer in gold should get a score."""
-        pipeline, feature_cols = trained_pipeline_and_features
-
-        gold_filled = gold_master.copy()
-        for col in feature_cols:
-            if col in gold_filled.columns:
-                gold_filled[col] = gold_filled[col].fillna(gold_filled[col].median())
+        pipeline, feature_cols, gold_filled = trained_pipeline_and_features
 
-        scored = score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
+        scored = scorer.score_all_customers(pipeline, gold_filled, feature_cols, threshold=0.5)
 
         assert len(scored) == len(gold_master)
 
@@ -1,7 +1,10 @@
 """Test that Settings loads correctly from environment."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pytest
+
 from configs.settings import AWSSettings, ModelSettings, Settings, get_settings
 
 
@@ -49,8 +52,5 @@ def test_env_override(monkeypatch):
 
 def test_settings_frozen():
     settings = get_settings()
-    try:
+    with pytest.raises(FrozenInstanceError):
         settings.log_level = "DEBUG"
-        assert False, "Should have raised FrozenInstanceError"
-    except AttributeError:
-        pass
@@ -1,5 +1,7 @@
 """Tests for src.data.silver — silver transforms."""
 
+import functools
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -12,8 +14,8 @@ from src.data.silver import (
 )
 
 
-@pytest.fixture
-def silver_customer():
+@functools.cache
+def _build_silver_customer() -> pd.DataFrame:
     return pd.DataFrame({
         "customer_id": ["C001", "C002", "C003", "C004"],
         "is_industrial": [0, 0, 1, 1],
@@ -23,23 +25,35 @@ def silver_customer():
     })
 
 
-@pytest.fixture
-def silver_customer_month():
+@functools.cache
+def _build_silver_customer_month() -> pd.DataFrame:
     return pd.DataFrame({
-        "customer_id": ["C001", "C001", "C002", "C002"],
-        "month": ["2024-01", "2024-02", "2024-01", "2024-02"],
-        "monthly_elec_kwh": [100.0, 120.0, 80.0, 90.0],
-        "monthly_gas_m3": [10.0, 12.0, 0.0, 0.0],
-        "elec_kwh_tier_1_peak": [40.0, 50.0, 30.0, 35.0],
-        "elec_kwh_tier_2_standard": [35.0, 40.0, 25.0, 30.0],
-        "elec_kwh_tier_3_offpeak": [25.0, 30.0, 25.0, 25.0],
-        "variable_price_tier1_eur_kwh": [0.15, np.nan, 0.14, 0.14],
-        "variable_price_tier2_eur_kwh": [0.12, 0.12, 0.11, np.nan],
-        "variable_price_tier3_eur_kwh": [0.08, 0.08, 0.07, 0.07],
-        "gas_variable_price_eur_m3": [0.50, 0.52, np.nan, np.nan],
+        "customer_id": np.array(["C001", "C001", "C002", "C002"], dtype=object),
+        "month": np.array(["2024-01", "2024-02", "2024-01", "2024-02"], dtype=object),
+        "monthly_elec_kwh": np.array([100.0, 120.0, 80.0, 90.0]),
+        "monthly_gas_m3": np.array([10.0, 12.0, 0.0, 0.0]),
+        "elec_kwh_tier_1_peak": np.array([40.0, 50.0, 30.0, 35.0]),
+        "elec_kwh_tier_2_standard": np.array([35.0, 40.0, 25.0, 30.0]),
+        "elec_kwh_tier_3_offpeak": np.array([25.0, 30.0, 25.0, 25.0]),
+        "variable_price_tier1_eur_kwh": np.array([0.15, np.nan, 0.14, 0.14]),
+        "variable_price_tier2_eur_kwh": np.array([0.12, 0.12, 0.11, np.nan]),
+        "variable_price_tier3_eur_kwh": np.array([0.08, 0.08, 0.07, 0.07]),
+        "gas_variable_price_eur_m3": np.array([0.50, 0.52, np.nan, np.nan]),
     })
 
 
+# Frames are built once per session; each test gets a shallow copy so column
+# assignments in one test cannot leak into another.
+@pytest.fixture
+def silver_customer():
+    return _build_silver_customer().copy(deep=False)
+
+
+@pytest.fixture
+def silver_customer_month():
+    return _build_silver_customer_month().copy(deep=False)
+
+
 class TestDeriveCustomerSegments:
     def test_residential_segment(self, silver_customer):
         result = derive_customer_segments(silver_customer)
@@ -64,6 +78,17 @@ class TestCleanSalesChannels:
         assert result.loc[result["customer_id"] == "C001", "sales_channel"].iloc[0] == "Comparison Website"
         assert result.loc[result["customer_id"] == "C004", "sales_channel"].iloc[0] == "Own Website"
 
+    def test_missing_channels_match_per_row_normalisation(self):
+        sc = pd.DataFrame({
+            "customer_id": ["C001", "C002", "C003", "C004"],
+            "sales_channel": np.array([" Comparador", None, np.nan, None], dtype=object),
+        })
+        result = clean_sales_channels(sc)
+        # None and NaN must come out exactly as astype(str) renders each of them
+        expected = sc["sales_channel"].astype(str).str.strip().str.lower()
+        expected = expected.map({"comparador": "Comparison Website"}).fillna(expected)
+        pd.testing.assert_series_equal(result["sales_channel"], expected)
+
 
 class TestImputePricesHierarchical:
     def test_fills_missing_prices(self, silver_customer_month, silver_customer):
@@ -72,6 +97,18 @@ class TestImputePricesHierarchical:
         c001_feb = result[(result["customer_id"] == "C001") & (result["month"] == "2024-02")]
         assert not c001_feb["variable_price_tier1_eur_kwh"].isna().any()
 
+    def test_backfills_within_customer_only(self, silver_customer):
+        scm = pd.DataFrame({
+            "customer_id": ["C001", "C001", "C002", "C002"],
+            "month": ["2024-01", "2024-02", "2024-01", "2024-02"],
+            "elec_kwh_tier_1_peak": [40.0, 50.0, 30.0, 35.0],
+            "variable_price_tier1_eur_kwh": [0.10, 0.10, np.nan, 0.20],
+        })
+        result = impute_prices_hierarchical(scm, silver_customer)
+        # C002's January gap comes from its own February price, not C001's rows
+        c002_jan = result[(result["customer_id"] == "C002") & (result["month"] == "2024-01")]
+        assert c002_jan["variable_price_tier1_eur_kwh"].iloc[0] == 0.20
+
     def test_no_data_loss(self, silver_customer_month, silver_customer):
         result = impute_prices_hierarchical(silver_customer_month, silver_customer)
         assert len(result) == len(silver_customer_month)
@@ -102,6 +139,9 @@ class TestComputeMargins:
         assert "elec_margin" in result.columns
         assert "gas_margin" in result.columns
         assert "total_margin" in result.columns
-        assert result["total_margin"].iloc[0] == pytest.approx(
-            result["total_revenue"].iloc[0] - result["total_cost"].iloc[0]
+        assert np.isclose(
+            result["total_margin"].iloc[0],
+            result["total_revenue"].iloc[0] - result["total_cost"].iloc[0],
+            rtol=1e-9,
+            atol=1e-12,
         )
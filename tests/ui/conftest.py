@@ -0,0 +1,103 @@
+"""Shared pytest configuration for the Streamlit UI tests."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+# src.serving.ui.data_loader applies @st.cache_data at import time. This conftest
+# is loaded before any module in tests/ui/ is imported, so the passthrough is in
+# place in time, and runs that never collect this directory skip Streamlit.
+st.cache_data = lambda **kwargs: lambda fn: fn
+
+
+# ---------------------------------------------------------------------------
+# Page-test frames: built once per session. The pages only read them (any
+# derived columns are added to a copy), so sharing one instance is safe.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def scored_df() -> pd.DataFrame:
+    """Scored customers covering every risk tier."""
+    return pd.DataFrame(
+        {
+            "customer_id": ["C001", "C002", "C003", "C004"],
+            "churn_proba": [0.92, 0.75, 0.40, 0.10],
+            "risk_tier": [
+                "Critical (>80%)",
+                "High (60-80%)",
+                "Medium (40-60%)",
+                "Low (<40%)",
+            ],
+            "segment": ["SME", "SME", "Residential", "Residential"],
+            "expected_monthly_loss": [500.0, 300.0, 100.0, 20.0],
+            "churn_pred": [1, 1, 0, 0],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def recommendations_df() -> pd.DataFrame:
+    """One recommendation per risk tier, one action each."""
+    return pd.DataFrame(
+        {
+            "customer_id": ["C001", "C002", "C003", "C004"],
+            "risk_tier": [
+                "Critical (>80%)",
+                "High (60-80%)",
+                "Medium (40-60%)",
+                "Low (<40%)",
+            ],
+            "risk_score": [0.92, 0.75, 0.45, 0.15],
+            "segment": ["SME", "SME", "Residential", "Residential"],
+            "action": [
+                "offer_large",
+                "offer_medium",
+                "offer_small",
+                "no_offer",
+            ],
+            "timing_window": [
+                "immediate",
+                "immediate",
+                "30_60_days",
+                "60_90_days",
+            ],
+            "expected_margin_impact": [500.0, 300.0, 100.0, 20.0],
+            "reason_codes": [
+                ["critical_churn_risk"],
+                ["high_churn_risk"],
+                ["moderate_churn_risk"],
+                ["low_risk_monitoring"],
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def lookup_scored_df() -> pd.DataFrame:
+    """Scored rows for the customer lookup page."""
+    return pd.DataFrame(
+        {
+            "customer_id": ["C001", "C002"],
+            "churn_proba": [0.85, 0.20],
+            "risk_tier": ["Critical (>80%)", "Low (<40%)"],
+            "avg_monthly_margin": [100.0, 50.0],
+            "segment": ["SME", "Residential"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def lookup_recommendations_df() -> pd.DataFrame:
+    """Recommendations matching lookup_scored_df."""
+    return pd.DataFrame(
+        {
+            "customer_id": ["C001", "C002"],
+            "action": ["offer_large", "no_offer"],
+            "timing_window": ["immediate", "60_90_days"],
+            "reason_codes": [["critical_churn_risk"], ["low_risk_monitoring"]],
+            "expected_margin_impact": [500.0, 10.0],
+        }
+    )
@@ -0,0 +1,246 @@
+"""Tests for src.serving.ui.data_loader — cached data loading."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.serving.ui import data_loader
+from src.serving.ui.data_loader import (
+    load_drift_results,
+    load_gold_data,
+    load_model_metrics,
+    load_pipeline_runs,
+    load_recommendations,
+    load_scored_data,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialise test JSON in one pass, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_parquet_cache(monkeypatch):
+    """Give each test an empty parquet memo so stubbed frames never outlive it."""
+    monkeypatch.setattr(data_loader, "_parquet_cache", {})
+
+
+@pytest.fixture
+def stub_read_parquet(monkeypatch):
+    """Serve a prepared frame from the loader's parquet reader instead of disk.
+
+    Only data_loader._read_parquet_table is replaced, so pyarrow and pandas'
+    own parquet engine stay untouched for anything else in the test. Returns a
+    function that installs the stub for ``df`` and returns the list of paths
+    the loader asked to read.
+    """
+
+    def _install(df: pd.DataFrame) -> list[Path]:
+        reads: list[Path] = []
+
+        def _read_parquet_table(path, columns):
+            reads.append(Path(path))
+            return df if columns is None else df[list(columns)]
+
+        monkeypatch.setattr(data_loader, "_read_parquet_table", _read_parquet_table)
+        return reads
+
+    return _install
+
+
+class TestLoadScoredData:
+    def test_load_from_local_parquet(self, tmp_path, stub_read_parquet):
+        df = pd.DataFrame({"customer_id": ["C1"], "churn_proba": [0.5]})
+        path = tmp_path / "scored.parquet"
+        path.touch()
+        reads = stub_read_parquet(df)
+        result = load_scored_data(source="local", path=str(path))
+        assert reads == [path]
+        assert len(result) == 1
+        assert "customer_id" in result.columns
+
+    def test_repeat_reads_cached_until_file_changes(self, tmp_path, stub_read_parquet):
+        path = tmp_path / "scored.parquet"
+        path.touch()
+        reads = stub_read_parquet(pd.DataFrame({"customer_id": ["C1"]}))
+        load_scored_data(source="local", path=str(path))
+        load_scored_data(source="local", path=str(path))
+        assert len(reads) == 1
+
+        mtime = path.stat().st_mtime
+        os.utime(path, (mtime + 10, mtime + 10))
+        load_scored_data(source="local", path=str(path))
+        assert len(reads) == 2
+        # The rewrite replaced the stale frame rather than caching alongside it
+        assert list(data_loader._parquet_cache) == [str(path)]
+
+    def test_column_pushdown(self, tmp_path):
+        df = pd.DataFrame({"customer_id": ["C1", "C2"]} | {f"f{i}": [0.1, 0.2] for i in range(9)})
+        path = tmp_path / "scored.parquet"
+        df.to_parquet(path, index=False)
+        result = load_scored_data(source="local", path=str(path), columns=["customer_id"])
+        assert result.columns.tolist() == ["customer_id"]
+        assert len(result) == 2
+
+    def test_column_pushdown_keeps_stored_index(self, tmp_path):
+        df = pd.DataFrame(
+            {"churn_proba": [0.2, 0.8], "segment": ["SME", "Residential"]},
+            index=pd.Index(["x", "y"], name="customer_id"),
+        )
+        path = tmp_path / "scored.parquet"
+        df.to_parquet(path)
+        result = load_scored_data(source="local", path=str(path), columns=["churn_proba"])
+        pd.testing.assert_frame_equal(result, pd.read_parquet(path, columns=["churn_proba"]))
+        assert result.index.tolist() == ["x", "y"]
+
+    def test_duckdb_filters_rows(self, tmp_path):
+        pytest.importorskip("duckdb")
+        df = pd.DataFrame({
+            "customer_id": [f"C{i:04d}" for i in range(1000)],
+            "churn_proba": [i / 1000 for i in range(1000)],
+        })
+        path = tmp_path / "scored.parquet"
+        df.to_parquet(path, index=False)
+        result = load_scored_data(source="duckdb", path=str(path), filters="churn_proba > 0.5")
+        assert len(result) == 499
+        assert (result["churn_proba"] > 0.5).all()
+
+    def test_filters_rejected_without_duckdb(self, tmp_path):
+        path = tmp_path / "scored.parquet"
+        pd.DataFrame({"churn_proba": [0.2, 0.8]}).to_parquet(path, index=False)
+        with pytest.raises(ValueError, match="duckdb"):
+            load_scored_data(source="local", path=str(path), filters="churn_proba > 0.5")
+
+    def test_duckdb_quotes_column_names(self, tmp_path):
+        pytest.importorskip("duckdb")
+        path = tmp_path / "scored.parquet"
+        pd.DataFrame({'odd"name': [1, 2], "other": [3, 4]}).to_parquet(path, index=False)
+        result = load_scored_data(source="duckdb", path=str(path), columns=['odd"name'])
+        assert result.columns.tolist() == ['odd"name']
+
+    def test_missing_file_returns_empty(self):
+        result = load_scored_data(source="local", path="/nonexistent/file.parquet")
+        assert isinstance(result, pd.DataFrame)
+        assert result.empty
+
+
+class TestLoadModelMetrics:
+    def test_load_from_local_json(self, tmp_path):
+        metrics = {"pr_auc": 0.82, "roc_auc": 0.90}
+        path = tmp_path / "metrics.json"
+        path.write_bytes(_dumps(metrics))
+        result = load_model_metrics(source="local", path=str(path))
+        assert result["pr_auc"] == 0.82
+
+    def test_stdlib_json_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(data_loader, "orjson", None)
+        path = tmp_path / "metrics.json"
+        path.write_bytes(_dumps({"pr_auc": 0.82}))
+        result = load_model_metrics(source="local", path=str(path))
+        assert result == {"pr_auc": 0.82}
+
+    def test_nan_written_by_stdlib_json(self, tmp_path):
+        path = tmp_path / "metrics.json"
+        path.write_text(json.dumps({"pr_auc": float("nan"), "lift": float("inf")}))
+        result = load_model_metrics(source="local", path=str(path))
+        assert math.isnan(result["pr_auc"])
+        assert result["lift"] == float("inf")
+
+    def test_missing_file_returns_empty_dict(self):
+        result = load_model_metrics(source="local", path="/nonexistent/metrics.json")
+        assert result == {}
+
+
+class TestLoadDriftResults:
+    def test_load_from_local_json(self, tmp_path):
+        drift = {"any_drift": True, "n_features_drifted": 2}
+        path = tmp_path / "drift.json"
+        path.write_bytes(_dumps(drift))
+        result = load_drift_results(source="local", path=str(path))
+        assert result["any_drift"] is True
+
+    def test_missing_file_returns_empty_dict(self):
+        result = load_drift_results(source="local", path="/nonexistent/drift.json")
+        assert result == {}
+
+
+class TestLoadPipelineRuns:
+    def test_load_from_local_json(self, tmp_path):
+        runs = [{"run_id": "r1", "status": "completed"}, {"run_id": "r2", "status": "started"}]
+        path = tmp_path / "runs.json"
+        path.write_bytes(_dumps(runs))
+        result = load_pipeline_runs(source="local", path=str(path))
+        assert result == tuple(runs)
+
+    def test_missing_file_returns_empty_tuple(self):
+        result = load_pipeline_runs(source="local", path="/nonexistent/runs.json")
+        assert result == ()
+
+
+class TestLoadGoldData:
+    def test_load_from_local_parquet(self, tmp_path, stub_read_parquet):
+        df = pd.DataFrame({"customer_id": ["C1"], "churn": [1], "segment": ["SME"]})
+        path = tmp_path / "gold.parquet"
+        path.touch()
+        reads = stub_read_parquet(df)
+        result = load_gold_data(source="local", path=str(path))
+        assert reads == [path]
+        assert len(result) == 1
+        assert "segment" in result.columns
+
+    def test_duckdb_projection_and_filter(self, tmp_path):
+        pytest.importorskip("duckdb")
+        df = pd.DataFrame({"customer_id": ["C1", "C2", "C3"], "churn": [1, 0, 1], "segment": ["SME", "SME", "Residential"]})
+        path = tmp_path / "gold.parquet"
+        df.to_parquet(path, index=False)
+        result = load_gold_data(
+            source="duckdb", path=str(path), columns=["customer_id", "churn"], filters="segment = 'SME'"
+        )
+        assert result.columns.tolist() == ["customer_id", "churn"]
+        assert result["customer_id"].tolist() == ["C1", "C2"]
+
+    def test_missing_file_returns_empty(self):
+        result = load_gold_data(source="local", path="/nonexistent/gold.parquet")
+        assert isinstance(result, pd.DataFrame)
+        assert result.empty
+
+
+class TestLoadRecommendations:
+    def test_load_from_local_parquet(self, tmp_path, stub_read_parquet):
+        df = pd.DataFrame(
+            {
+                "customer_id": ["C1", "C2"],
+                "risk_score": [0.9, 0.3],
+                "action": ["offer_large", "no_offer"],
+            }
+        )
+        path = tmp_path / "recommendations.parquet"
+        path.touch()
+        reads = stub_read_parquet(df)
+        result = load_recommendations(source="local", path=str(path))
+        assert reads == [path]
+        assert len(result) == 2
+        assert "action" in result.columns
+
+    def test_filters_rejected_without_duckdb(self, tmp_path):
+        with pytest.raises(ValueError, match="duckdb"):
+            load_recommendations(source="local", path=str(tmp_path / "reco.parquet"), filters="risk_score > 0.5")
+
+    def test_missing_file_returns_empty(self):
+        result = load_recommendations(source="local", path="/nonexistent/reco.parquet")
+        assert isinstance(result, pd.DataFrame)
+        assert result.empty
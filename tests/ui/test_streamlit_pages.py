@@ -0,0 +1,546 @@
+"""Tests for Streamlit UI page render functions."""
+
+from __future__ import annotations
+
+from unittest.mock import DEFAULT, MagicMock, call, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.serving.ui.pages import (
+    customer_lookup,
+    customer_risk,
+    data_explorer,
+    drift_monitor,
+    model_performance,
+    overview,
+    pipeline_status,
+    recommendations,
+)
+
+
+def _patch_page(module, *loaders):
+    """Patch ``st`` and the named data loaders on a page module in one call."""
+    return patch.multiple(module, st=DEFAULT, **dict.fromkeys(loaders, DEFAULT))
+
+
+def _called_once_with(mock: MagicMock, *args, **kwargs) -> None:
+    """Assert a single call with exactly these arguments, comparing call_args directly."""
+    assert mock.call_count == 1
+    assert (mock.call_args.args, mock.call_args.kwargs) == (args, kwargs)
+
+
+def _columns_factory(*methods: str):
+    """st.columns side_effect that builds spec'd columns only when render() asks.
+
+    Accepts st.columns' int or width-list spec. Columns allow only ``methods``
+    (``metric`` by default) plus the context-manager protocol, so pages can also
+    enter them with ``with``. Rows are kept on ``.rows`` in call order.
+    """
+    spec = [*(methods or ("metric",)), "__enter__", "__exit__"]
+    rows: list[list[MagicMock]] = []
+
+    def _columns(layout, **kwargs):
+        n = layout if isinstance(layout, int) else len(layout)
+        rows.append([MagicMock(spec=spec) for _ in range(n)])
+        return rows[-1]
+
+    _columns.rows = rows
+    return _columns
+
+
+# ---------------------------------------------------------------------------
+# Empty-data early returns (every page except Overview)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("page", "header", "empty_loaders", "notice"),
+    [
+        (model_performance, "Model Performance", {"load_model_metrics": {}}, "warning"),
+        (drift_monitor, "Drift Monitor", {"load_drift_results": {}}, "info"),
+        (customer_risk, "Customer Risk Overview", {"load_scored_data": pd.DataFrame()}, "warning"),
+        (pipeline_status, "Pipeline Status", {"load_pipeline_runs": ()}, "info"),
+        (
+            recommendations,
+            "Retention Recommendations",
+            {"load_recommendations": pd.DataFrame()},
+            "warning",
+        ),
+        (
+            customer_lookup,
+            "Customer Lookup",
+            {"load_scored_data": pd.DataFrame(), "load_recommendations": pd.DataFrame()},
+            "warning",
+        ),
+        (data_explorer, "Data Explorer", {"load_gold_data": pd.DataFrame()}, "warning"),
+    ],
+    ids=[
+        "model_performance",
+        "drift_monitor",
+        "customer_risk",
+        "pipeline_status",
+        "recommendations",
+        "customer_lookup",
+        "data_explorer",
+    ],
+)
+def test_no_data(page, header, empty_loaders, notice):
+    """Empty loader output shows a single warning/info and returns early."""
+    with _patch_page(page, *empty_loaders) as mocks:
+        for name, value in empty_loaders.items():
+            mocks[name].return_value = value
+
+        page.render()
+
+    mocks["st"].header.assert_called_once_with(header)
+    getattr(mocks["st"], notice).assert_called_once()
+    mocks["st"].columns.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Model Performance page
+# ---------------------------------------------------------------------------
+
+
+class TestModelPerformancePage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(model_performance, "load_model_metrics") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks):
+        """With valid metrics, st.columns and col.metric are called with key values."""
+        mock_st, mock_loader = mocks["st"], mocks["load_model_metrics"]
+        mock_loader.return_value = {
+            "pr_auc": 0.82,
+            "roc_auc": 0.90,
+            "precision": 0.75,
+            "recall": 0.70,
+            "tp": 100,
+            "fp": 20,
+            "fn": 30,
+            "tn": 850,
+        }
+
+        columns = mock_st.columns.side_effect = _columns_factory()
+
+        model_performance.render()
+
+        mock_st.header.assert_called_once_with("Model Performance")
+        mock_st.warning.assert_not_called()
+
+        # Verify all four metric cards (one call each)
+        assert [c.metric.call_args_list for c in columns.rows[0]] == [
+            [call("PR-AUC", "0.8200")],
+            [call("ROC-AUC", "0.9000")],
+            [call("Precision", "0.7500")],
+            [call("Recall", "0.7000")],
+        ]
+
+        # Confusion matrix should be rendered (tp+fp+fn+tn > 0)
+        mock_st.subheader.assert_any_call("Confusion Matrix")
+        mock_st.plotly_chart.assert_called_once()
+
+        # All metrics JSON dump
+        mock_st.subheader.assert_any_call("All Metrics")
+        mock_st.json.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Drift Monitor page
+# ---------------------------------------------------------------------------
+
+
+class TestDriftMonitorPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(drift_monitor, "load_drift_results") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks):
+        """With drift results, metrics and feature table are rendered."""
+        mock_st, mock_loader = mocks["st"], mocks["load_drift_results"]
+        mock_loader.return_value = {
+            "any_drift": True,
+            "n_features_drifted": 2,
+            "summary": "2 of 5 features drifted",
+            "feature_drift": {
+                "feature_results": [
+                    {
+                        "feature": "cons_12m",
+                        "ks_statistic": 0.15,
+                        "p_value": 0.001,
+                        "drifted": True,
+                    },
+                    {
+                        "feature": "tenure_months",
+                        "ks_statistic": 0.04,
+                        "p_value": 0.45,
+                        "drifted": False,
+                    },
+                ],
+            },
+            "prediction_drift": {
+                "ks_statistic": 0.08,
+                "p_value": 0.02,
+            },
+        }
+
+        columns = mock_st.columns.side_effect = _columns_factory()
+
+        drift_monitor.render()
+
+        mock_st.header.assert_called_once_with("Drift Monitor")
+        mock_st.info.assert_not_called()
+
+        # Top-level drift metrics
+        assert [c.metric.call_args_list for c in columns.rows[0]] == [
+            [call("Drift Detected", "Yes")],
+            [call("Features Drifted", 2)],
+        ]
+
+        # Summary text
+        mock_st.text.assert_called_once_with("2 of 5 features drifted")
+
+        # Feature drift details table and chart
+        mock_st.subheader.assert_any_call("Feature Drift Details")
+        mock_st.dataframe.assert_called_once()
+        mock_st.plotly_chart.assert_called_once()
+
+        # Prediction drift metrics
+        mock_st.subheader.assert_any_call("Prediction Drift")
+        # Two st.metric calls for prediction drift (ks_statistic + p-value)
+        assert mock_st.metric.call_count == 2
+
+    def test_highlight_drifted_rows(self):
+        """Drifted rows are shaded in every cell; other rows get no style."""
+        table = pd.DataFrame(
+            {
+                "feature": ["cons_12m", "tenure_months"],
+                "ks_statistic": [0.15, 0.04],
+                "p_value": [0.001, 0.45],
+                "status": ["DRIFTED", "OK"],
+            },
+            index=[3, 7],
+        )
+
+        styles = drift_monitor._highlight_drifted(table)
+
+        expected = pd.DataFrame(
+            [["background-color: #ffcccc"] * 4, [""] * 4],
+            index=table.index,
+            columns=table.columns,
+        )
+        pd.testing.assert_frame_equal(styles, expected, check_dtype=False)
+
+
+# ---------------------------------------------------------------------------
+# Customer Risk page
+# ---------------------------------------------------------------------------
+
+
+class TestCustomerRiskPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(customer_risk, "load_scored_data") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks, scored_df):
+        """With scored data, metrics, charts, and customer table are rendered."""
+        mock_st, mock_loader = mocks["st"], mocks["load_scored_data"]
+        mock_loader.return_value = scored_df
+
+        columns = mock_st.columns.side_effect = _columns_factory()
+
+        # selectbox returns "All" (no filtering)
+        mock_st.selectbox.return_value = "All"
+        # slider returns 50 (default)
+        mock_st.slider.return_value = 50
+
+        customer_risk.render()
+        cols4 = columns.rows[0]  # first st.columns row holds the metric cards
+
+        mock_st.header.assert_called_once_with("Customer Risk Overview")
+        mock_st.warning.assert_not_called()
+
+        # Key metric cards (one call each)
+        assert [c.metric.call_args_list for c in cols4] == [
+            [call("Total Customers", 4)],
+            [call("Critical Risk", 1)],
+            [call("High Risk", 1)],
+            [call("Expected Monthly Loss", "\u20ac920")],
+        ]
+
+        # Customer details table rendered
+        mock_st.subheader.assert_any_call("Customer Details")
+
+
+# ---------------------------------------------------------------------------
+# Pipeline Status page
+# ---------------------------------------------------------------------------
+
+
+class TestPipelineStatusPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(pipeline_status, "load_pipeline_runs") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks):
+        """With run data, metrics and run history table are rendered."""
+        mock_st, mock_loader = mocks["st"], mocks["load_pipeline_runs"]
+        mock_loader.return_value = (
+            {
+                "run_id": "r-001",
+                "file_key": "raw/data_2025_01.csv",
+                "status": "completed",
+                "started_at": "2025-01-15T10:00:00Z",
+                "completed_at": "2025-01-15T10:15:00Z",
+            },
+            {
+                "run_id": "r-002",
+                "file_key": "raw/data_2025_02.csv",
+                "status": "started",
+                "started_at": "2025-02-01T08:00:00Z",
+            },
+            {
+                "run_id": "r-003",
+                "file_key": "raw/data_2025_03.csv",
+                "status": "failed",
+                "started_at": "2025-03-01T09:00:00Z",
+                "completed_at": "2025-03-01T09:02:00Z",
+            },
+        )
+
+        columns = mock_st.columns.side_effect = _columns_factory()
+
+        mock_st.selectbox.return_value = "All"
+
+        pipeline_status.render()
+        cols4 = columns.rows[0]  # first st.columns row holds the metric cards
+
+        mock_st.header.assert_called_once_with("Pipeline Status")
+        mock_st.info.assert_not_called()
+
+        # Key metric cards (one call each)
+        assert [c.metric.call_args_list for c in cols4] == [
+            [call("Total Runs", 3)],
+            [call("Completed", 1)],
+            [call("In Progress", 1)],
+            [call("Failed", 1)],
+        ]
+
+        # Run history table
+        mock_st.subheader.assert_any_call("Run History")
+        mock_st.dataframe.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Overview page
+# ---------------------------------------------------------------------------
+
+
+class TestOverviewPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(
+            overview, "load_scored_data", "load_model_metrics", "load_pipeline_runs"
+        ) as mocks:
+            yield mocks
+
+    def test_no_data(self, mocks):
+        """Empty data results in em-dash placeholders."""
+        mock_st = mocks["st"]
+        mocks["load_scored_data"].return_value = pd.DataFrame()
+        mocks["load_model_metrics"].return_value = {}
+        mocks["load_pipeline_runs"].return_value = ()
+
+        mock_st.columns.side_effect = _columns_factory("metric", "info")
+
+        overview.render()
+
+        mock_st.header.assert_called_once_with(
+            "SpanishGas Churn Intelligence \u2014 Overview"
+        )
+
+    def test_with_data(self, mocks):
+        """With valid data, KPI metrics are rendered."""
+        mock_st = mocks["st"]
+        mocks["load_scored_data"].return_value = pd.DataFrame(
+            {
+                "customer_id": ["C001", "C002", "C003"],
+                "risk_tier": [
+                    "Critical (>80%)",
+                    "High (60-80%)",
+                    "Low (<40%)",
+                ],
+                "expected_monthly_loss": [500.0, 200.0, 10.0],
+            }
+        )
+        mocks["load_model_metrics"].return_value = {
+            "metrics": {"pr_auc": 0.75, "roc_auc": 0.88}
+        }
+        mocks["load_pipeline_runs"].return_value = (
+            {"run_id": "r1", "status": "completed"},
+            {"run_id": "r2", "status": "started"},
+        )
+
+        mock_st.columns.side_effect = _columns_factory("metric", "info")
+
+        overview.render()
+
+        mock_st.header.assert_called_once_with(
+            "SpanishGas Churn Intelligence \u2014 Overview"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Recommendations page
+# ---------------------------------------------------------------------------
+
+
+class TestRecommendationsPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(recommendations, "load_recommendations") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks, recommendations_df):
+        """With recommendations data, metrics, chart, and table are rendered."""
+        mock_st, mock_loader = mocks["st"], mocks["load_recommendations"]
+        mock_loader.return_value = recommendations_df
+
+        columns = mock_st.columns.side_effect = _columns_factory()
+        mock_st.selectbox.return_value = "All"
+        mock_st.slider.return_value = 50
+
+        recommendations.render()
+        cols4 = columns.rows[0]  # first st.columns row holds the metric cards
+
+        mock_st.header.assert_called_once_with("Retention Recommendations")
+        mock_st.warning.assert_not_called()
+
+        # Summary metric
+        _called_once_with(cols4[0].metric, "Total Recommendations", 4)
+        _called_once_with(cols4[1].metric, "Distinct Actions", 4)
+
+        subheaders = {c.args[0] for c in mock_st.subheader.call_args_list}
+
+        # Bar chart
+        assert "Recommendations by Action Type" in subheaders
+        mock_st.plotly_chart.assert_called_once()
+
+        # Filterable table
+        assert "Recommendation Details" in subheaders
+        mock_st.dataframe.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Customer Lookup page
+# ---------------------------------------------------------------------------
+
+
+class TestCustomerLookupPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(customer_lookup, "load_scored_data", "load_recommendations") as mocks:
+            yield mocks
+
+    def test_customer_found(self, mocks, lookup_scored_df, lookup_recommendations_df):
+        """Valid customer ID renders risk assessment and financial impact."""
+        mock_st = mocks["st"]
+        mocks["load_scored_data"].return_value = lookup_scored_df
+        mocks["load_recommendations"].return_value = lookup_recommendations_df
+
+        # text_input returns valid customer ID
+        mock_st.text_input.return_value = "C001"
+
+        columns = mock_st.columns.side_effect = _columns_factory("metric", "markdown")
+
+        customer_lookup.render()
+        cols4 = columns.rows[0]  # first st.columns row holds the metric cards
+
+        mock_st.header.assert_called_once_with("Customer Lookup")
+        mock_st.error.assert_not_called()
+        mock_st.warning.assert_not_called()
+
+        subheaders = {c.args[0] for c in mock_st.subheader.call_args_list}
+
+        # Risk assessment metrics rendered
+        assert "Risk Assessment" in subheaders
+        _called_once_with(cols4[1].metric, "Risk Tier", "Critical (>80%)")
+        _called_once_with(cols4[2].metric, "Recommended Action", "Large Retention Offer")
+
+        # Financial impact rendered
+        assert "Financial Impact" in subheaders
+
+        # Reason codes go in an expander; MagicMock handles the with-block itself
+        mock_st.expander.assert_called_once_with("Why This Recommendation", expanded=False)
+
+    def test_customer_not_found(self, mocks):
+        """Invalid customer ID triggers error message."""
+        mock_st = mocks["st"]
+        mocks["load_scored_data"].return_value = pd.DataFrame(
+            {
+                "customer_id": ["C001"],
+                "churn_proba": [0.5],
+                "risk_tier": ["Medium (40-60%)"],
+                "avg_monthly_margin": [80.0],
+            }
+        )
+        mocks["load_recommendations"].return_value = pd.DataFrame()
+        mock_st.text_input.return_value = "INVALID"
+
+        customer_lookup.render()
+
+        mock_st.header.assert_called_once_with("Customer Lookup")
+        mock_st.error.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Data Explorer page
+# ---------------------------------------------------------------------------
+
+
+class TestDataExplorerPage:
+    @pytest.fixture
+    def mocks(self):
+        with _patch_page(data_explorer, "load_gold_data") as mocks:
+            yield mocks
+
+    def test_with_data(self, mocks):
+        """With gold master data, charts are rendered."""
+        mock_st, mock_loader = mocks["st"], mocks["load_gold_data"]
+        # Explicit dtypes skip inference; "string" keeps the missing sentiment as <NA>
+        # on pandas 2.x and 3.x alike.
+        mock_loader.return_value = pd.DataFrame(
+            {
+                "customer_id": pd.array(["C001", "C002", "C003", "C004"], dtype="string"),
+                "segment": pd.array(["SME", "SME", "Residential", "Corporate"], dtype="string"),
+                "churn": np.array([1, 0, 1, 0], dtype=np.int64),
+                "renewal_bucket": pd.array(["0-3m", "3-6m", "6-12m", "0-3m"], dtype="string"),
+                "sentiment_label": pd.array(["Negative", "Positive", None, "Neutral"], dtype="string"),
+                "avg_monthly_margin": np.array([100.0, 50.0, 80.0, -20.0]),
+                "is_dual_fuel": np.array([1, 0, 1, 0], dtype=np.int64),
+            }
+        )
+
+        mock_st.columns.side_effect = _columns_factory()
+
+        data_explorer.render()
+
+        mock_st.header.assert_called_once_with("Data Explorer")
+        mock_st.warning.assert_not_called()
+
+        # Every analysis section is rendered
+        subheaders = {c.args[0] for c in mock_st.subheader.call_args_list}
+        assert {
+            "Customer Segment Breakdown",
+            "Churn Rate by Renewal Proximity",
+            "Sentiment Impact on Churn",
+            "Profitability by Segment",
+            "Dual-Fuel Analysis",
+            "Key Assumptions & Methodology",
+        } <= subheaders